@@ -1,8 +1,23 @@
 import math
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import Dict, Union
 
-@dataclass(frozen=True)
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# Scale factors to internal 'N-mm' units: (length, stress, result)
+_VRDMAX_SCALES = {
+    "N-mm-rad": (1.0, 1.0, 1.0),
+    "kN-m-rad": (1000.0, 0.001, 0.001),
+}
+# Scale factors to internal 'N-mm' units: (length, area, stress, result)
+_VRDC_SCALES = {
+    'N-mm': (1.0, 1.0, 1.0, 1.0),
+    'kN-m': (1000.0, 1.0e6, 0.001, 0.001),
+}
+
+@dataclass(frozen=True, slots=True)
 class VRdmaxResult:
     # Inputs
     bw: float
@@ -22,44 +37,55 @@ class VRdmaxResult:
     tanθ: float
     cotθ: float
 
+    # LaTeX templates for `to_latex`, filled with str.format
+    _TPL_INPUTS = (
+        r"$$\begin{{array}}{{l l}}"
+        r"b_w = {0}~\mathrm{{{8}}} & d = {1}~\mathrm{{{8}}} \\ "
+        r"f_{{ck}} = {2}~\mathrm{{{9}}} & f_{{yk}} = {3}~\mathrm{{{9}}} \\ "
+        r"f_{{ywk}} = {4}~\mathrm{{{9}}} & \theta = {5}~\mathrm{{rad}} \\ "
+        r"\alpha_{{cw}} = {6} & \gamma_c = {7}"
+        r"\end{{array}}$$"
+    )
+    _TPL_INTER = (
+        r"$$\begin{{array}}{{l l}}"
+        r"z = {0}~\mathrm{{{5}}} & "
+        r"f_{{cd}} = {1}~\mathrm{{{6}}} \\ "
+        r"\nu_1 = {2} & "
+        r"\tan\theta = {3},~\cot\theta = {4}"
+        r"\end{{array}}$$"
+    )
+    _TPL_EXPR = (
+        r"\begin{{align}}"
+        r"V_{{Rd,\max}} &= \frac{{\alpha_{{cw}} \cdot b_w \cdot z \cdot \nu_1 \cdot f_{{cd}}}}{{\cot\theta + \tan\theta}}\\[3pt]"
+        r"&= {0}~\text{{{1}}}"
+        r"\end{{align}}"
+    )
+
     def to_latex(self, show_inputs: bool = True, with_steps: bool = True, decimals: int = 3) -> str:
         """Return a LaTeX string for V_Rd,max formula and results."""
-        def q(x: float) -> str:
-            return f"{x:.{decimals}f}"
+        q = f"{{:.{decimals}f}}".format
         V_unit = "N" if self.units == "N-mm-rad" else "kN"
         L_unit = "mm" if self.units == "N-mm-rad" else "m"
         f_unit = "N/mm^2"
 
-        inputs = (
-            "$$" +
-            rf"\begin{{array}}{{l l}}"
-            rf"b_w = {q(self.bw)}~\mathrm{{{L_unit}}} & d = {q(self.d)}~\mathrm{{{L_unit}}} \\ "
-            rf"f_{{ck}} = {q(self.fck)}~\mathrm{{{f_unit}}} & f_{{yk}} = {q(self.fyk)}~\mathrm{{{f_unit}}} \\ "
-            rf"f_{{ywk}} = {q(self.fywk)}~\mathrm{{{f_unit}}} & \theta = {q(self.θ)}~\mathrm{{rad}} \\ "
-            rf"\alpha_{{cw}} = {q(self.αcw)} & \gamma_c = {q(self.γc)}"
-            r"\end{array}$$" 
-        ) if show_inputs else ""
-
-        
-        # Optional intermediate values
-        inter = (
-            "$$" +
-            rf"\begin{{array}}{{l l}}"
-            rf"z = {q(self.z)}~\mathrm{{{L_unit}}} & "
-            rf"f_{{cd}} = {q(self.fcd)}~\mathrm{{{f_unit}}} \\ "
-            rf"\nu_1 = {q(self.v1)} & "
-            rf"\tan\theta = {q(self.tanθ)},~\cot\theta = {q(self.cotθ)}"
-            r"\end{array}$$" 
-        ) if with_steps else ""
-
         # Core expression
-        expr = (
-            r"\begin{align}"
-            r"V_{Rd,\max} &= \frac{\alpha_{cw} \cdot b_w \cdot z \cdot \nu_1 \cdot f_{cd}}{\cot\theta + \tan\theta}\\[3pt]"
-            rf"&= {q(self.value)}~\text{{{V_unit}}}"
-            r"\end{align}"
-        )
-        return "\n".join([x for x in [inputs, inter, expr] if x])
+        expr = self._TPL_EXPR.format(q(self.value), V_unit)
+        if not show_inputs and not with_steps:
+            return expr
+
+        parts = []
+        if show_inputs:
+            parts.append(self._TPL_INPUTS.format(
+                q(self.bw), q(self.d), q(self.fck), q(self.fyk), q(self.fywk),
+                q(self.θ), q(self.αcw), q(self.γc), L_unit, f_unit,
+            ))
+        # Optional intermediate values
+        if with_steps:
+            parts.append(self._TPL_INTER.format(
+                q(self.z), q(self.fcd), q(self.v1), q(self.tanθ), q(self.cotθ), L_unit, f_unit,
+            ))
+        parts.append(expr)
+        return "\n".join(parts)
 
 
 def VRdmax(
@@ -91,15 +117,17 @@ def VRdmax(
         αcw: Coefficient accounting for the state of stress in the compression chord.
         γc: Partial safety factor for concrete (default 1.5).
         units: Unit system, one of 'N-mm-rad' (default) or 'kN-m-rad'.
-        include_intermediates: If True, return a dict with intermediate values; otherwise return the numeric value.
+        include_intermediates: If True, return a `VRdmaxResult` with intermediate values; otherwise return the numeric value.
 
     Returns:
-        float or dict: If `include_intermediates` is False, returns the shear resistance
-        as a float (units depend on the `units` argument). If True, returns a dict with
-        keys 'value', 'z', 'fcd' and 'v1' containing intermediate values.
+        float or VRdmaxResult: If `include_intermediates` is False, returns the shear
+        resistance as a float (units depend on the `units` argument). If True, returns a
+        `VRdmaxResult` holding the inputs, `value` and the intermediates 'z', 'fcd',
+        'v1', 'tanθ' and 'cotθ'.
 
     Raises:
-        ValueError: If an unsupported `units` string is provided.
+        ValueError: If an unsupported `units` string is provided, or if θ is not
+            strictly between 0 and π/2.
 
     Notes:
         The expression used is:
@@ -116,26 +144,128 @@ def VRdmax(
         ```
 
     """
-    if units not in ("N-mm-rad", "kN-m-rad"):
-        raise ValueError("units must be 'N-mm-rad' or 'kN-m-rad'")
-
-    # Normalize units
-    sL = 1000.0 if units == "kN-m-rad" else 1.0
-    sF = 0.001 if units == "kN-m-rad" else 1.0
-    bw_, d_ = bw * sL, d * sL
-    fck_, fyk_, fywk_ = fck * sF, fyk * sF, fywk * sF
+    try:
+        sL, sF, sV = _VRDMAX_SCALES[units]
+    except KeyError:
+        raise ValueError("units must be 'N-mm-rad' or 'kN-m-rad'") from None
+    if not 0.0 < θ < math.pi / 2:
+        raise ValueError("θ must lie strictly between 0 and π/2 rad")
 
     # Core calculations
-    z = 0.9 * d_
-    fcd = fck_ / γc
-    v1 = (0.6 if fywk_ < 0.8 * fyk_ else 0.6 * (1 - fck_ / 250.0))
-    tanθ, cotθ = math.tan(θ), 1 / math.tan(θ)
-    value = αcw * bw_ * z * v1 * fcd / (tanθ + cotθ)
-    if units == "kN-m-rad":
-        value *= 0.001
+    value, z, fcd, v1 = _vrdmax_core(
+        bw * sL, d * sL, fck * sF, fyk * sF, fywk * sF, θ, αcw, γc
+    )
+    value *= sV
+    if not include_intermediates:
+        return value
+
+    tanθ = math.tan(θ)
+    return VRdmaxResult(bw, d, fck, fyk, fywk, θ, αcw, γc, units, value, z, fcd, v1, tanθ, 1.0 / tanθ)
+
+
+def VRdmax_batch(
+    bw: ArrayLike,
+    d: ArrayLike,
+    fck: ArrayLike,
+    fyk: ArrayLike,
+    fywk: ArrayLike,
+    θ: ArrayLike,
+    αcw: ArrayLike = 1.0,
+    γc: ArrayLike = 1.5,
+    units: str = "N-mm-rad",
+) -> NDArray[np.float64]:
+    """Compute V_Rd,max over arrays of inputs, e.g. for parametric studies.
 
-    res = VRdmaxResult(bw, d, fck, fyk, fywk, θ, αcw, γc, units, value, z, fcd, v1, tanθ, cotθ)
-    return res if include_intermediates else res.value
+    Arguments have the same meaning and units as in `VRdmax`, but may be scalars or
+    NumPy arrays of any broadcast-compatible shapes.
+
+    Returns:
+        ndarray: The shear resistance for each broadcast combination of the inputs
+        (units depend on the `units` argument); 0-d when all inputs are scalars.
+
+    Raises:
+        ValueError: If an unsupported `units` string is provided, or if any θ is
+            not strictly between 0 and π/2.
+
+    Example:
+        ```python
+        import numpy as np
+        θ = np.radians(np.linspace(21.8, 45.0, 50))
+        values = VRdmax_batch(250., 539., 20., 500., 500., θ)
+        ```
+
+    """
+    try:
+        sL, sF, sV = _VRDMAX_SCALES[units]
+    except KeyError:
+        raise ValueError("units must be 'N-mm-rad' or 'kN-m-rad'") from None
+    bw, d, fck, fyk, fywk, θ, αcw, γc = (
+        np.asarray(x, dtype=np.float64) for x in (bw, d, fck, fyk, fywk, θ, αcw, γc)
+    )
+    if np.any(~((θ > 0.0) & (θ < math.pi / 2))):  # also rejects NaN
+        raise ValueError("θ must lie strictly between 0 and π/2 rad")
+
+    kernel = _vrdmax_ufunc()
+    if kernel is None:
+        kernel = _vrdmax_kernel
+    value = kernel(bw * sL, d * sL, fck * sF, fyk * sF, fywk * sF, θ, αcw, γc)
+    # Arithmetic on 0-d arrays yields NumPy scalars; keep the documented ndarray
+    return np.asarray(value * sV)
+
+
+def _vrdmax_core(bw, d, fck, fyk, fywk, θ, αcw, γc):
+    """Scalar V_Rd,max core in 'N-mm-rad'; returns (value, z, fcd, v1).
+
+    This is the reference implementation: `VRdmax` calls it directly and
+    `VRdmax_batch` compiles it into a ufunc when numba is available.
+    """
+    z = 0.9 * d
+    fcd = fck / γc
+    # ν1 per EN 1992-1-1 6.2.3(3) Note 2, (6.10.aN)/(6.10.bN), when the shear
+    # reinforcement stress is below 0.8 fyk; otherwise ν1 = ν from (6.6N).
+    # Select between precomputed candidates so the choice lowers to min/max and
+    # conditional moves rather than a nested branch ladder
+    v1_hi = max(0.5, 0.9 - fck / 200.0) if fck > 60.0 else 0.6
+    v1_lo = 0.6 * (1.0 - fck / 250.0)
+    v1 = v1_hi if fywk < 0.8 * fyk else v1_lo
+    # cotθ + tanθ = 2 / sin(2θ)
+    value = αcw * bw * z * v1 * fcd * math.sin(2.0 * θ) / 2.0
+    return value, z, fcd, v1
+
+
+@cache
+def _vrdmax_ufunc():
+    """Return `_vrdmax_core` compiled into a numba ufunc, or None without numba.
+
+    numba is optional (the 'numba' extra). It is imported, and the ufunc compiled,
+    on the first batch call so that importing this module stays cheap.
+    """
+    try:
+        from numba import njit, vectorize
+    except ImportError:
+        return None
+    core = njit(cache=True)(_vrdmax_core)
+
+    @vectorize(["float64(float64, float64, float64, float64, float64, float64, float64, float64)"], cache=True)
+    def vrdmax(bw, d, fck, fyk, fywk, θ, αcw, γc):
+        return core(bw, d, fck, fyk, fywk, θ, αcw, γc)[0]
+
+    return vrdmax
+
+
+def _vrdmax_kernel(bw, d, fck, fyk, fywk, θ, αcw, γc):
+    """NumPy counterpart of `_vrdmax_core` over float64 arrays; returns the value array.
+
+    Used by `VRdmax_batch` when numba is not installed. Keep it in step with
+    `_vrdmax_core`.
+    """
+    z = 0.9 * d
+    fcd = fck / γc
+    v1_hi = np.where(fck > 60.0, np.maximum(0.5, 0.9 - fck / 200.0), 0.6)
+    v1_lo = 0.6 * (1.0 - fck / 250.0)
+    v1 = np.where(fywk < 0.8 * fyk, v1_hi, v1_lo)
+    # cotθ + tanθ = 2 / sin(2θ)
+    return αcw * bw * z * v1 * fcd * np.sin(2.0 * θ) / 2.0
 
 
 def VRdc(
@@ -145,8 +275,9 @@ def VRdc(
     σcp: float,
     bw: float,
     d: float,
-    units: str = 'N-mm'
-) -> Dict[str, float]:
+    units: str = 'N-mm',
+    include_intermediates: bool = False,
+) -> Union[float, Dict[str, float]]:
     """Compute the design value for the shear resistance V_Rd,c.
 
     Units are 'N-mm', unless specified otherwise. Alternative options are: 'kN-m'
@@ -170,10 +301,17 @@ def VRdc(
         bw: Smallest width of the cross-section in the tensile area [mm].
         d: Effective depth of the cross-section [mm].
         units: Unit system, one of 'N-mm' (default) or 'kN-m'.
+        include_intermediates: If True, return a dict with intermediate values;
+            otherwise return the numeric value.
 
     Returns:
-        Dictionary containing intermediate values and the final result in [N], 
-        unless specified otherwise. Intermediate results are always 'N-mm'.
+        float or dict: If `include_intermediates` is False, returns the shear resistance
+        as a float in [N], unless specified otherwise. If True, returns a dictionary
+        containing intermediate values and the final result under 'value'.
+        Intermediate results are always 'N-mm'.
+
+    Raises:
+        ValueError: If an unsupported `units` string is provided.
 
     Notes:
         The expressions used are:
@@ -192,40 +330,40 @@ def VRdc(
         - \\(k_1 = 0.15\\)
 
     """
-    _VRdc = {}
-
-    if units == 'N-mm':
-        pass
-    elif units == 'kN-m':
-        Asl = Asl * 10 ** 6
-        fck *= 0.001
-        σcp *= 0.001
-        bw *= 1000
-        d *= 1000
-    else:
-        pass
-
-    ρl = min(Asl / (bw * d), 0.02)
-    k = min(1 + (200.0 / d) ** 0.5, 2.0)
-    vmin = 0.035 * k ** 1.5 * fck ** 0.5
+    try:
+        sL, sA, sF, sV = _VRDC_SCALES[units]
+    except KeyError:
+        raise ValueError("units must be 'N-mm' or 'kN-m'") from None
+
+    ρl, k, vmin, k1, VRdc1, VRdc2, value = _vrdc_core(
+        CRdc, Asl * sA, fck * sF, σcp * sF, bw * sL, d * sL
+    )
+    value *= sV
+    if not include_intermediates:
+        return value
+
+    return {
+        'ρl': ρl,
+        'k': k,
+        'vmin': vmin,
+        'k1': k1,
+        'VRdc1': VRdc1,
+        'VRdc2': VRdc2,
+        'value': value,
+    }
+
+
+# Design checks are often repeated with identical arguments and the core is pure;
+# a cache hit is several times cheaper than the cbrt/sqrt evaluation it skips.
+@lru_cache(maxsize=4096)
+def _vrdc_core(CRdc, Asl, fck, σcp, bw, d):
+    """Scalar V_Rd,c core in 'N-mm'; returns (ρl, k, vmin, k1, VRdc1, VRdc2, value)."""
+    bw_d = bw * d
+    ρl = min(Asl / bw_d, 0.02)
+    k = min(1 + math.sqrt(200.0 / d), 2.0)
+    vmin = 0.035 * k * math.sqrt(k) * math.sqrt(fck)
     k1 = 0.15
 
-    VRdc1 = (CRdc * k * math.pow((100 * ρl * fck), (1 / 3)) + k1 * σcp) * bw * d
-    VRdc2 = (vmin + k1 * σcp) * bw * d
-
-    _VRdc['ρl'] = ρl
-    _VRdc['k'] = k
-    _VRdc['vmin'] = vmin
-    _VRdc['k1'] = k1
-    _VRdc['VRdc1'] = VRdc1
-    _VRdc['VRdc2'] = VRdc2
-    _VRdc['value'] = max(VRdc1, VRdc2)
-
-    if units == 'N-mm':
-        pass
-    elif units == 'kN-m':
-        _VRdc['value'] *= 0.001
-    else:
-        pass
-
-    return _VRdc
\ No newline at end of file
+    VRdc1 = (CRdc * k * math.cbrt(100.0 * ρl * fck) + k1 * σcp) * bw_d
+    VRdc2 = (vmin + k1 * σcp) * bw_d
+    return ρl, k, vmin, k1, VRdc1, VRdc2, max(VRdc1, VRdc2)